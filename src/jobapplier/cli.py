@@ -11,7 +11,8 @@ from rich.traceback import install
 
 from .config import AppConfig, load_config
 from .profile import CandidateProfile, load_profile
-from .workflow import AgentWorkflow, build_context
+from .crawl_queue import run_worker
+from .workflow import AgentWorkflow, build_context, build_queue, build_sources
 
 install()
 app = typer.Typer(help="JobApplier agent CLI")
@@ -27,6 +28,10 @@ def run(
     config: Path = typer.Option(Path("samples/config.yaml"), help="Path to config file"),
     profile: Path = typer.Option(Path("samples/profile.yaml"), help="Path to profile file"),
     verbose: bool = typer.Option(False, "--verbose", help="Enable debug logging"),
+    distributed: bool = typer.Option(
+        False, "--distributed", help="Split the crawl into queued tasks for `jobapplier worker` processes"
+    ),
+    work: bool = typer.Option(True, "--work/--no-work", help="Let the coordinator crawl tasks too (with --distributed)"),
 ) -> None:
     """Run a single agent cycle: search jobs, request approval, and apply."""
 
@@ -36,7 +41,37 @@ def run(
         cfg: AppConfig = load_config(config)
         prof: CandidateProfile = load_profile(profile)
         ctx = build_context(cfg, prof)
-        AgentWorkflow(ctx).run_once()
+        if distributed:
+            AgentWorkflow(ctx).run_distributed(build_queue(cfg), work=work)
+        else:
+            AgentWorkflow(ctx).run_once()
+    except Exception as exc:  # noqa: BLE001
+        console.print(f"[bold red]Error:[/] {exc}")
+        raise typer.Exit(code=1) from exc
+
+
+@app.command()
+def worker(
+    config: Path = typer.Option(Path("samples/config.yaml"), help="Path to config file"),
+    profile: Path = typer.Option(Path("samples/profile.yaml"), help="Path to profile file"),
+    drain: bool = typer.Option(False, "--drain", help="Exit once the queue has no claimable tasks"),
+    verbose: bool = typer.Option(False, "--verbose", help="Enable debug logging"),
+) -> None:
+    """Claim crawl tasks from the shared queue and write results back."""
+
+    try:
+        if verbose:
+            logging.basicConfig(level=logging.INFO)
+        cfg: AppConfig = load_config(config)
+        prof: CandidateProfile = load_profile(profile)
+        processed = run_worker(
+            build_queue(cfg),
+            build_sources(cfg),
+            prof,
+            poll_interval=cfg.queue.poll_interval,
+            drain=drain,
+        )
+        console.print(f"Processed {processed} crawl tasks.")
     except Exception as exc:  # noqa: BLE001
         console.print(f"[bold red]Error:[/] {exc}")
         raise typer.Exit(code=1) from exc
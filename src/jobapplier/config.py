@@ -28,6 +28,25 @@ class StorageConfig(BaseModel):
     """State persistence configuration."""
 
     path: Path = Path(".jobapplier-state.json")
+    # Forget seen jobs this many days after they were first seen (None keeps them
+    # forever); a listing still open after that is surfaced again.
+    retention_days: Optional[int] = None
+    # Fold the append-only seen-index delta into the base after this many IDs.
+    compact_threshold: int = 4096
+
+
+class QueueConfig(BaseModel):
+    """Shared crawl work-queue configuration for distributed runs."""
+
+    path: Path = Path(".jobapplier-queue.sqlite")
+    page_size: int = 25
+    lease_seconds: float = 60.0
+    max_attempts: int = 3
+    poll_interval: float = 2.0
+    # The coordinator gives up on unfinished tasks after this many seconds.
+    run_timeout: float = 3600.0
+    # Runs left behind by a dead coordinator are deleted after this many seconds.
+    purge_after: float = 86400.0
 
 
 class AppConfig(BaseModel):
@@ -36,6 +55,7 @@ class AppConfig(BaseModel):
     job_sources: List[JobSourceConfig]
     notifications: NotificationConfig = Field(default_factory=NotificationConfig)
     storage: StorageConfig = Field(default_factory=StorageConfig)
+    queue: QueueConfig = Field(default_factory=QueueConfig)
     scoring: Dict[str, Any] = Field(default_factory=dict)
     approvals: Dict[str, Any] = Field(default_factory=dict)
 
@@ -0,0 +1,337 @@
+"""SQLite-backed crawl work queue for spreading searches across workers."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from .profile import CandidateProfile
+from .sources.base import JobPosting, JobSourceAdapter
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    source_index INTEGER NOT NULL,
+    source_name TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    owner TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    posted_since REAL,
+    exhausted INTEGER NOT NULL DEFAULT 0,
+    created_at REAL
+);
+CREATE INDEX IF NOT EXISTS tasks_claim ON tasks (status, lease_expires);
+CREATE TABLE IF NOT EXISTS results (
+    task_id INTEGER NOT NULL REFERENCES tasks (id),
+    job TEXT NOT NULL
+);
+"""
+
+
+@dataclass
+class CrawlTask:
+    id: int
+    run_id: str
+    source_index: int
+    source_name: str
+    start: int
+    count: int
+    attempts: int
+    posted_since: Optional[float] = None
+
+
+def plan_tasks(sources: List[JobSourceAdapter], page_size: int) -> List[tuple[int, str, int, int]]:
+    """Split each source into `(source_index, name, start, count)` page ranges.
+
+    Only adapters that declare `paginated = True` accept a `start` offset; the
+    rest are crawled as a single task.
+    """
+
+    plan: List[tuple[int, str, int, int]] = []
+    for idx, source in enumerate(sources):
+        total = int(getattr(source, "limit", 20))
+        if not getattr(source, "paginated", False):
+            plan.append((idx, source.name, 0, total))
+            continue
+        for start in range(0, total, page_size):
+            plan.append((idx, source.name, start, min(page_size, total - start)))
+    return plan
+
+
+class CrawlQueue:
+    """Shared task queue with leases, heartbeats and expiry.
+
+    Every call opens its own connection so the queue can be used from several
+    threads and processes on one host. SQLite locking is unreliable on network
+    filesystems, so sharing the file across hosts is not supported.
+    """
+
+    def __init__(self, path: str | Path, lease_seconds: float = 60.0, max_attempts: int = 3) -> None:
+        self.path = Path(path)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _expire(self, conn: sqlite3.Connection, now: float) -> None:
+        """Fail expired leases that have used up their attempts instead of handing them out again."""
+
+        conn.execute(
+            "UPDATE tasks SET status = 'failed', owner = NULL, lease_expires = NULL, "
+            "error = COALESCE(error, 'lease expired') "
+            "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+            (now, self.max_attempts),
+        )
+
+    def enqueue_run(
+        self,
+        sources: List[JobSourceAdapter],
+        page_size: int,
+        posted_since: Optional[List[Optional[float]]] = None,
+        purge_after: Optional[float] = None,
+    ) -> str:
+        """Queue a run's tasks, first deleting runs older than `purge_after` seconds."""
+
+        run_id = uuid.uuid4().hex
+        now = time.time()
+        since = posted_since or [None] * len(sources)
+        rows = [(run_id, *task, since[task[0]], now) for task in plan_tasks(sources, page_size)]
+        with self._transaction() as conn:
+            if purge_after is not None:
+                stale = [
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT DISTINCT run_id FROM tasks WHERE created_at < ?", (now - purge_after,)
+                    )
+                ]
+                for stale_id in stale:
+                    self._delete_run(conn, stale_id)
+                if stale:
+                    logger.info("Purged %s stale crawl runs", len(stale))
+            conn.executemany(
+                "INSERT INTO tasks (run_id, source_index, source_name, start, count, posted_since, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        logger.info("Crawl run %s queued %s tasks", run_id, len(rows))
+        return run_id
+
+    def claim(self, owner: str, run_id: Optional[str] = None) -> Optional[CrawlTask]:
+        """Lease the oldest pending (or expired) task to `owner`."""
+
+        now = time.time()
+        query = (
+            "SELECT id, run_id, source_index, source_name, start, count, attempts, posted_since FROM tasks "
+            "WHERE (status = 'pending' OR (status = 'leased' AND lease_expires < ?))"
+        )
+        params: list = [now]
+        if run_id:
+            query += " AND run_id = ?"
+            params.append(run_id)
+        query += " ORDER BY id LIMIT 1"
+        with self._transaction() as conn:
+            self._expire(conn, now)
+            row = conn.execute(query, params).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE tasks SET status = 'leased', owner = ?, lease_expires = ?, attempts = attempts + 1 WHERE id = ?",
+                (owner, now + self.lease_seconds, row[0]),
+            )
+        task = CrawlTask(*row)
+        task.attempts += 1
+        return task
+
+    def heartbeat(self, task: CrawlTask, owner: str) -> bool:
+        """Extend the lease; returns False if the task was reclaimed by someone else."""
+
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET lease_expires = ? WHERE id = ? AND owner = ? AND status = 'leased'",
+                (time.time() + self.lease_seconds, task.id, owner),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, task: CrawlTask, owner: str, jobs: List[JobPosting], exhausted: bool = True) -> None:
+        """Store a task's postings; `exhausted` records that the source ran out of results."""
+
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET status = 'done', lease_expires = NULL, exhausted = ? "
+                "WHERE id = ? AND owner = ? AND status = 'leased'",
+                (int(exhausted), task.id, owner),
+            )
+            if cursor.rowcount != 1:
+                logger.warning("Crawl task %s lost its lease before completion; dropping results", task.id)
+                return
+            conn.executemany(
+                "INSERT INTO results (task_id, job) VALUES (?, ?)",
+                [(task.id, json.dumps(asdict(job))) for job in jobs],
+            )
+
+    def fail(self, task: CrawlTask, owner: str, error: str) -> None:
+        status = "failed" if task.attempts >= self.max_attempts else "pending"
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE tasks SET status = ?, owner = NULL, lease_expires = NULL, error = ? "
+                "WHERE id = ? AND owner = ? AND status = 'leased'",
+                (status, error, task.id, owner),
+            )
+
+    def run_status(self, run_id: str) -> Dict[str, int]:
+        with self._transaction() as conn:
+            self._expire(conn, time.time())
+            rows = conn.execute(
+                "SELECT status, COUNT(*) FROM tasks WHERE run_id = ? GROUP BY status", (run_id,)
+            ).fetchall()
+        return dict(rows)
+
+    def failed_sources(self, run_id: str) -> set[int]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT source_index FROM tasks WHERE run_id = ? AND status = 'failed'", (run_id,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def exhausted_sources(self, run_id: str) -> set[int]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT source_index FROM tasks WHERE run_id = ? AND status = 'done' AND exhausted = 1",
+                (run_id,),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def results(self, run_id: str) -> List[JobPosting]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT r.job FROM results r JOIN tasks t ON t.id = r.task_id WHERE t.run_id = ? ORDER BY r.rowid",
+                (run_id,),
+            ).fetchall()
+        return [JobPosting(**json.loads(row[0])) for row in rows]
+
+    def abandon_run(self, run_id: str, reason: str) -> None:
+        """Fail a run's unfinished tasks; late completions from workers are then dropped."""
+
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE tasks SET status = 'failed', owner = NULL, lease_expires = NULL, error = ? "
+                "WHERE run_id = ? AND status IN ('pending', 'leased')",
+                (reason, run_id),
+            )
+
+    def purge_run(self, run_id: str) -> None:
+        """Delete a merged run's tasks and results so the queue file stays small."""
+
+        with self._transaction() as conn:
+            self._delete_run(conn, run_id)
+
+    @staticmethod
+    def _delete_run(conn: sqlite3.Connection, run_id: str) -> None:
+        conn.execute("DELETE FROM results WHERE task_id IN (SELECT id FROM tasks WHERE run_id = ?)", (run_id,))
+        conn.execute("DELETE FROM tasks WHERE run_id = ?", (run_id,))
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+def process_task(
+    queue: CrawlQueue,
+    task: CrawlTask,
+    owner: str,
+    sources: List[JobSourceAdapter],
+    profile: CandidateProfile,
+) -> None:
+    """Run one claimed task, renewing its lease in the background until done."""
+
+    stop = threading.Event()
+
+    def _beat() -> None:
+        while not stop.wait(queue.lease_seconds / 3):
+            if not queue.heartbeat(task, owner):
+                logger.warning("Crawl task %s heartbeat rejected", task.id)
+                return
+
+    beater = threading.Thread(target=_beat, daemon=True)
+    beater.start()
+    try:
+        if task.source_index >= len(sources) or sources[task.source_index].name != task.source_name:
+            raise ValueError(
+                f"Worker config does not match task source #{task.source_index} ({task.source_name})"
+            )
+        source = sources[task.source_index]
+        logger.info("Crawl task %s: %s start=%s count=%s", task.id, task.source_name, task.start, task.count)
+        if getattr(source, "paginated", False):
+            jobs = source.search_jobs(
+                profile, limit=task.count, start=task.start, posted_since=task.posted_since
+            )
+        else:
+            jobs = source.search_jobs(profile, limit=task.count, posted_since=task.posted_since)
+        if not getattr(source, "last_search_ok", True):
+            raise RuntimeError(f"{task.source_name} search did not complete")
+    except Exception as exc:  # noqa: BLE001
+        stop.set()
+        logger.warning("Crawl task %s failed (attempt %s): %s", task.id, task.attempts, exc)
+        queue.fail(task, owner, str(exc))
+        return
+    stop.set()
+    queue.complete(task, owner, jobs, exhausted=getattr(source, "exhausted", True))
+
+
+def run_worker(
+    queue: CrawlQueue,
+    sources: List[JobSourceAdapter],
+    profile: CandidateProfile,
+    owner: Optional[str] = None,
+    poll_interval: float = 5.0,
+    drain: bool = False,
+) -> int:
+    """Claim and process tasks until stopped (or, with `drain`, until the queue is empty)."""
+
+    owner = owner or default_worker_id()
+    processed = 0
+    while True:
+        task = queue.claim(owner)
+        if task is None:
+            if drain:
+                return processed
+            time.sleep(poll_interval)
+            continue
+        process_task(queue, task, owner, sources, profile)
+        processed += 1
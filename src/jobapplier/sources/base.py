@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Protocol
+from typing import Any, Callable, Dict, Iterable, List, Protocol
 
 from ..profile import CandidateProfile
 
@@ -32,7 +32,18 @@ class JobSourceAdapter(Protocol):
 
     name: str
 
-    def search_jobs(self, profile: CandidateProfile, limit: int = 20) -> List[JobPosting]:
+    def search_jobs(
+        self,
+        profile: CandidateProfile,
+        limit: int = 20,
+        posted_since: float | None = None,
+        is_seen: Callable[[str], bool] | None = None,
+    ) -> List[JobPosting]:
+        """Return up to `limit` postings.
+
+        `posted_since` (epoch seconds) lets adapters skip older results server-side;
+        IDs for which `is_seen` is true are skipped and do not count towards `limit`.
+        """
         ...
 
     def apply(self, job: JobPosting, profile: CandidateProfile) -> ApplicationResult:
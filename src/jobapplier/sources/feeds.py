@@ -0,0 +1,424 @@
+"""Streaming RSS/Atom and JSON-API job-source adapters."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+import httpx
+
+from ..profile import CandidateProfile
+from .base import ApplicationResult, JobPosting, registry
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "jobapplier/0.1 (+https://github.com/DawidKrzoska/JobApplier)"
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _timestamp(value: Any) -> Optional[float]:
+    """Parse RSS/ISO dates or epoch (milli)seconds into epoch seconds."""
+
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return value / 1000 if value > 1e11 else float(value)
+    text = str(value).strip()
+    try:
+        parsed = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _lookup(item: Any, path: str | None) -> Any:
+    """Resolve a dotted path (e.g. `categories.location`) inside a decoded JSON item."""
+
+    if not path:
+        return None
+    for part in path.split("."):
+        if not isinstance(item, dict):
+            return None
+        item = item.get(part)
+    return item
+
+
+class _JsonStream:
+    """Incremental JSON reader that decodes one value at a time from byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        # Drop consumed text so the buffer only holds the current value.
+        self._buf = self._buf[self._pos :]
+        self._pos = 0
+        try:
+            self._buf += self._utf8.decode(next(self._chunks))
+        except StopIteration:
+            self._buf += self._utf8.decode(b"", final=True)
+            self._eof = True
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character ('' at end of input)."""
+
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self._pos} of JSON feed")
+        self._pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A value ending exactly at the buffer edge (e.g. a number) may continue.
+            if end == len(self._buf) and not self._eof:
+                self._fill()
+                continue
+            self._pos = end
+            return value
+
+    def items(self, path: List[str]) -> Iterator[Any]:
+        """Yield the elements of the array found at `path`, skipping everything else."""
+
+        if path:
+            self.expect("{")
+            while self.peek() != "}":
+                key = self.value()
+                self.expect(":")
+                if key == path[0]:
+                    yield from self.items(path[1:])
+                    return
+                self.value()
+                if self.peek() == ",":
+                    self._pos += 1
+            return
+        self.expect("[")
+        while self.peek() != "]":
+            yield self.value()
+            if self.peek() == ",":
+                self._pos += 1
+
+
+class FeedJobSource(ABC):
+    """Shared HTTP plumbing for machine-readable feeds: streaming and conditional GETs.
+
+    Subclasses implement `_decode` for their wire format.
+    """
+
+    name = "feed"
+
+    def __init__(
+        self,
+        url: str,
+        company: str | None = None,
+        location: str | None = None,
+        limit: int = 500,
+        headers: Dict[str, str] | None = None,
+        validators: str | None = ".jobapplier-feeds.json",
+        timeout: float = 30.0,
+    ) -> None:
+        if not url:
+            raise ValueError(f"{self.name} adapter requires a feed url.")
+        self.url = url
+        self.company = company
+        self.location = location
+        self.limit = limit
+        self.validators_path = Path(validators) if validators else None
+        self.last_search_ok = True
+        self.exhausted = True
+        self.pending_validators: Optional[Dict[str, str]] = None
+        self.client = httpx.Client(
+            headers={"user-agent": USER_AGENT, **(headers or {})},
+            timeout=timeout,
+            follow_redirects=True,
+        )
+
+    @property
+    def state_key(self) -> str:
+        return f"{self.name}:{self.url}"
+
+    def _load_validators(self) -> Dict[str, Dict[str, str]]:
+        if not self.validators_path or not self.validators_path.exists():
+            return {}
+        try:
+            return json.loads(self.validators_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def commit_search(self) -> None:
+        """Persist the last fully read response's validators.
+
+        Called by the workflow only after the postings have been reviewed, so a
+        crash in between cannot turn them into a 304 on the next run.
+        """
+
+        if self.pending_validators is None:
+            return
+        try:
+            self._save_validators(self.pending_validators)
+        except OSError as exc:
+            logger.warning("Could not persist feed validators: %s", exc)
+        self.pending_validators = None
+
+    def _save_validators(self, cached: Dict[str, str]) -> None:
+        if not self.validators_path:
+            return
+        data = self._load_validators()
+        data[self.url] = cached
+        tmp_path = self.validators_path.with_name(f"{self.validators_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data, indent=2))
+        os.replace(tmp_path, self.validators_path)
+
+    @abstractmethod
+    def _decode(self, chunks: Iterable[bytes]) -> Iterator[JobPosting]:
+        """Yield postings incrementally from the raw response body chunks."""
+
+    def search_jobs(
+        self,
+        profile: CandidateProfile,
+        limit: int | None = None,
+        posted_since: float | None = None,
+        is_seen: Callable[[str], bool] | None = None,
+    ) -> List[JobPosting]:
+        """Stream the feed and return up to `limit` postings not matched by `is_seen`.
+
+        `posted_since` is accepted for the adapter protocol but not applied: the
+        body is downloaded either way, and publish dates in feeds are too loose
+        (caching, ATS creation dates) to filter on safely.
+        """
+
+        max_results = limit or self.limit
+        jobs: List[JobPosting] = []
+        self.last_search_ok = True
+        # Cleared when `limit` cuts the feed short, so the workflow keeps the
+        # previous watermark and validators; seen postings are skipped before
+        # `limit` applies, so the next run reads further into the feed.
+        self.exhausted = True
+        self.pending_validators = None
+
+        headers: Dict[str, str] = {}
+        cached = self._load_validators().get(self.url, {})
+        if cached.get("etag"):
+            headers["if-none-match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["if-modified-since"] = cached["last_modified"]
+
+        try:
+            with self.client.stream("GET", self.url, headers=headers) as response:
+                if response.status_code == 304:
+                    logger.info("%s feed unchanged: %s", self.name, self.url)
+                    return jobs
+                response.raise_for_status()
+                for job in self._decode(response.iter_bytes()):
+                    if is_seen and is_seen(job.id):
+                        continue
+                    jobs.append(job)
+                    if len(jobs) >= max_results:
+                        self.exhausted = False
+                        break
+                validators = {
+                    "etag": response.headers.get("etag", ""),
+                    "last_modified": response.headers.get("last-modified", ""),
+                }
+        except (httpx.HTTPError, ParseError, ValueError) as exc:
+            logger.warning("%s feed failed (%s): %s", self.name, self.url, exc)
+            self.last_search_ok = False
+            return jobs
+
+        # Only offer validators for fully read feeds, otherwise the 304 would
+        # hide the postings past `limit` on the next run.
+        if self.exhausted and any(validators.values()):
+            self.pending_validators = validators
+        logger.info("%s feed yielded %s jobs from %s", self.name, len(jobs), self.url)
+        return jobs
+
+    def apply(self, job: JobPosting, profile: CandidateProfile) -> ApplicationResult:
+        message = f"{self.name} adapter cannot auto-apply; please use the provided URL to submit the application."
+        return ApplicationResult(job_id=job.id, applied=False, message=message)
+
+
+class RssJobSource(FeedJobSource):
+    """RSS 2.0 / Atom feeds, parsed item by item with a pull parser."""
+
+    name = "rss"
+
+    def _decode(self, chunks: Iterable[bytes]) -> Iterator[JobPosting]:
+        parser = XMLPullParser(events=("start", "end"))
+        stack: List[Element] = []
+        for chunk in chunks:
+            parser.feed(chunk)
+            for event, elem in parser.read_events():
+                if event == "start":
+                    stack.append(elem)
+                    continue
+                stack.pop()
+                if _local(elem.tag) not in ("item", "entry"):
+                    continue
+                job = self._posting(elem)
+                # Detach the finished item so the tree never holds the whole feed.
+                if stack:
+                    stack[-1].remove(elem)
+                if job:
+                    yield job
+        parser.close()
+
+    def _posting(self, elem: Element) -> Optional[JobPosting]:
+        fields: Dict[str, str] = {}
+        for child in elem:
+            tag = _local(child.tag)
+            if tag == "link" and child.get("href"):
+                fields.setdefault("link", child.get("href", ""))
+            elif tag == "author":
+                name = next((node.text for node in child if _local(node.tag) == "name"), child.text)
+                fields.setdefault("author", (name or "").strip())
+            else:
+                fields.setdefault(tag, (child.text or "").strip())
+
+        url = fields.get("link", "")
+        job_id = fields.get("guid") or fields.get("id") or url
+        title = fields.get("title")
+        if not job_id or not title:
+            return None
+        posted = _timestamp(fields.get("pubDate") or fields.get("published") or fields.get("updated"))
+        return JobPosting(
+            id=job_id,
+            title=title,
+            company=self.company or fields.get("creator") or fields.get("author") or "",
+            location=self.location or fields.get("location", ""),
+            description=fields.get("description") or fields.get("summary") or fields.get("content") or "",
+            url=url,
+            source=self.name,
+            metadata={"raw_id": job_id, "posted_at": posted},
+        )
+
+
+class JsonJobSource(FeedJobSource):
+    """JSON APIs exposing postings as an array, decoded one posting at a time.
+
+    `items_path` is the dotted key path to the array (empty for a top-level
+    array) and `fields` maps `JobPosting` attributes to dotted item paths.
+    """
+
+    name = "json"
+    default_fields: Dict[str, str] = {
+        "id": "id",
+        "title": "title",
+        "company": "company",
+        "location": "location",
+        "description": "description",
+        "url": "url",
+        "posted": "posted_at",
+    }
+
+    def __init__(self, url: str, items_path: str = "", fields: Dict[str, str] | None = None, **options: Any) -> None:
+        super().__init__(url, **options)
+        self.items_path = [part for part in items_path.split(".") if part]
+        self.fields = {**self.default_fields, **(fields or {})}
+
+    def _decode(self, chunks: Iterable[bytes]) -> Iterator[JobPosting]:
+        for item in _JsonStream(chunks).items(self.items_path):
+            job = self._posting(item)
+            if job:
+                yield job
+
+    def _posting(self, item: Any) -> Optional[JobPosting]:
+        def field(key: str) -> str:
+            value = _lookup(item, self.fields.get(key))
+            return "" if value is None else str(value).strip()
+
+        job_id = field("id")
+        title = field("title")
+        if not job_id or not title:
+            return None
+        return JobPosting(
+            id=job_id,
+            title=title,
+            company=self.company or field("company"),
+            location=self.location or field("location"),
+            description=field("description"),
+            url=field("url"),
+            source=self.name,
+            metadata={"raw_id": job_id, "posted_at": _timestamp(_lookup(item, self.fields.get("posted")))},
+        )
+
+
+class LeverJobSource(JsonJobSource):
+    """Lever postings API (`api.lever.co/v0/postings/<company>`)."""
+
+    name = "lever"
+    default_fields = {
+        "id": "id",
+        "title": "text",
+        "location": "categories.location",
+        "description": "descriptionPlain",
+        "url": "hostedUrl",
+        "posted": "createdAt",
+    }
+
+    def __init__(self, company: str, **options: Any) -> None:
+        url = options.pop("url", None) or f"https://api.lever.co/v0/postings/{company}?mode=json"
+        super().__init__(url, company=company, **options)
+
+
+class GreenhouseJobSource(JsonJobSource):
+    """Greenhouse job board API (`boards-api.greenhouse.io/v1/boards/<board>/jobs`)."""
+
+    name = "greenhouse"
+    default_fields = {
+        "id": "id",
+        "title": "title",
+        "location": "location.name",
+        "description": "content",
+        "url": "absolute_url",
+        "posted": "updated_at",
+    }
+
+    def __init__(self, board: str, **options: Any) -> None:
+        url = options.pop("url", None) or f"https://boards-api.greenhouse.io/v1/boards/{board}/jobs?content=true"
+        options.setdefault("items_path", "jobs")
+        options.setdefault("company", board)
+        super().__init__(url, **options)
+
+
+registry.register("rss", RssJobSource)
+registry.register("json", JsonJobSource)
+registry.register("lever", LeverJobSource)
+registry.register("greenhouse", GreenhouseJobSource)
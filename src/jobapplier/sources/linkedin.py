@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import math
+import os
 import re
-from typing import List
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+from urllib.parse import urlencode
 
 import httpx
 from bs4 import BeautifulSoup, Tag
@@ -19,12 +25,165 @@ USER_AGENT = (
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
     "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 )
+# Widen the posted-since window so postings indexed late are not missed.
+POSTED_SINCE_SLACK = 3600
+# Smallest page LinkedIn serves while more results remain; a shorter page is the last one.
+MIN_PAGE_SIZE = 10
+# The guest search endpoint does not page past this offset.
+MAX_OFFSET = 1000
+
+
+# Pages can mix card markup variants, so cards are always matched against all of them.
+CARD_SELECTOR = "li.jobs-search-results__list-item, div.base-card[data-entity-urn], li.job-card-container"
+# Candidate selectors per field, covering the markup variants LinkedIn serves.
+SELECTOR_CANDIDATES: Dict[str, List[str]] = {
+    "link": [
+        "a.base-card__full-link",
+        "a.job-card-container__link",
+        "a.job-card-list__title",
+        "a.result-card__full-card-link",
+    ],
+    "title": [".base-search-card__title", ".job-card-list__title", ".sr-only"],
+    "company": [
+        ".base-search-card__subtitle",
+        ".job-card-container__primary-description",
+        ".hidden-nested-link",
+    ],
+    "location": [".job-search-card__location", ".job-card-container__metadata-item"],
+    "description": [
+        ".base-search-card__snippet",
+        ".job-card-container__metadata-item--bullet",
+        ".job-card-container__metadata-wrapper",
+    ],
+}
+
+
+class SelectorPlan:
+    """Adaptive per-field selector ordering driven by recorded hit statistics.
+
+    Selectors are tried in descending hit-rate order. Ones that have missed
+    `min_trials` times without a single hit go dormant: those of `required`
+    fields are still probed whenever the active ones miss, optional fields
+    only on every `probe_every`-th full miss, so a markup switch is still
+    picked up. Counts are halved past `window` tries to let the plan follow
+    such switches.
+
+    Several processes may share `path`: each save merges this process's new
+    counts into whatever is on disk and replaces the file atomically, so
+    concurrent saves can at worst drop a few counts.
+    """
+
+    def __init__(
+        self,
+        candidates: Dict[str, List[str]],
+        path: str | Path | None = None,
+        min_trials: int = 50,
+        window: int = 2000,
+        probe_every: int = 25,
+    ) -> None:
+        self.candidates = candidates
+        self.path = Path(path) if path else None
+        self.min_trials = min_trials
+        self.window = window
+        self.probe_every = probe_every
+        self._misses: Dict[str, int] = {field: 0 for field in candidates}
+        # field -> selector -> [tries, hits]
+        self.stats: Dict[str, Dict[str, List[float]]] = {
+            field: {selector: [0, 0] for selector in selectors} for field, selectors in candidates.items()
+        }
+        self._plan: Dict[str, Tuple[List[str], List[str]]] = {}
+        self._load()
+        self.compile()
+
+    def _read(self) -> Dict[str, Dict[str, List[float]]]:
+        if not self.path or not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable selector stats %s: %s", self.path, exc)
+            return {}
+
+    def _load(self) -> None:
+        saved = self._read()
+        for field, selectors in self.stats.items():
+            for selector, counts in saved.get(field, {}).items():
+                if selector in selectors:
+                    selectors[selector] = list(counts)
+        # Counts as last read from disk; `save` only adds what was recorded since.
+        self._baseline = {
+            field: {selector: list(counts) for selector, counts in selectors.items()}
+            for field, selectors in self.stats.items()
+        }
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        saved = self._read()
+        for field, selectors in self.stats.items():
+            for selector, counts in selectors.items():
+                stored = saved.get(field, {}).get(selector, [0, 0])
+                base = self._baseline[field][selector]
+                merged = [stored[i] + counts[i] - base[i] for i in range(2)]
+                if merged[0] > self.window:
+                    merged = [merged[0] / 2, merged[1] / 2]
+                counts[:] = merged
+                self._baseline[field][selector] = list(merged)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self.stats, indent=2))
+        os.replace(tmp_path, self.path)
+
+    def compile(self) -> None:
+        """Rebuild the `(active, dormant)` selector order for every field."""
+
+        for field, selectors in self.stats.items():
+            ranked = sorted(
+                self.candidates[field],
+                key=lambda sel: (selectors[sel][1] + 1) / (selectors[sel][0] + 2),
+                reverse=True,
+            )
+            active = [sel for sel in ranked if selectors[sel][1] or selectors[sel][0] < self.min_trials]
+            dormant = [sel for sel in ranked if sel not in active]
+            self._plan[field] = (active, dormant)
+
+    def _attempts(self, field: str, probe: bool) -> Iterator[Tuple[str, List[float]]]:
+        active, dormant = self._plan[field]
+        selectors = self.stats[field]
+        for selector in (*active, *dormant) if probe else active:
+            yield selector, selectors[selector]
+
+    def first(
+        self,
+        node: Tag | None,
+        field: str,
+        extract: Callable[[Tag], Any],
+        required: bool = False,
+    ) -> Any:
+        """Return the first non-empty `extract(match)` across the field's selectors."""
+
+        if node is None:
+            return None
+        self._misses[field] += 1
+        probe = required or self._misses[field] % self.probe_every == 0
+        for selector, counts in self._attempts(field, probe):
+            counts[0] += 1
+            match = node.select_one(selector)
+            value = extract(match) if match else None
+            if value:
+                counts[1] += 1
+                self._misses[field] = 0
+                return value
+        return None
+
+    def first_text(self, node: Tag | None, field: str, required: bool = False) -> str | None:
+        return self.first(node, field, lambda match: match.get_text(strip=True), required)
 
 
 class LinkedInJobSource:
     """Fetch job postings from LinkedIn public search pages."""
 
     name = "linkedin"
+    paginated = True
 
     def __init__(
         self,
@@ -33,6 +192,13 @@ class LinkedInJobSource:
         limit: int = 25,
         remote: bool | None = None,
         experience_level: str | None = None,
+        job_type: str | None = None,
+        sort_by: str | None = "DD",
+        posted_within_days: int | None = None,
+        title_include: List[str] | None = None,
+        title_exclude: List[str] | None = None,
+        location_exclude: List[str] | None = None,
+        selector_stats: str | None = ".jobapplier-selectors.json",
         session_cookie: str | None = None,
         timeout: float = 15.0,
     ) -> None:
@@ -43,7 +209,16 @@ class LinkedInJobSource:
         self.limit = limit
         self.remote = remote
         self.experience_level = experience_level
+        self.job_type = job_type  # f_JT, e.g. "F" (full-time) or "F,C"
+        self.sort_by = sort_by  # "DD" (most recent) or "R" (relevance)
+        self.posted_within_days = posted_within_days
+        self.title_include = [kw.lower() for kw in title_include or []]
+        self.title_exclude = [kw.lower() for kw in title_exclude or []]
+        self.location_exclude = [kw.lower() for kw in location_exclude or []]
         self.timeout = timeout
+        self.last_search_ok = True
+        self.exhausted = False
+        self.selector_plan = SelectorPlan(SELECTOR_CANDIDATES, selector_stats)
 
         headers = {"user-agent": USER_AGENT}
         cookies = {}
@@ -58,7 +233,28 @@ class LinkedInJobSource:
             follow_redirects=True,
         )
 
-    def _params(self, start: int) -> dict:
+    @property
+    def state_key(self) -> str:
+        """Identify the query by every parameter sent except paging and the posted-since window."""
+
+        params = self._params(0)
+        params.pop("start")
+        params.pop("f_TPR", None)
+        return f"{self.name}:{urlencode(sorted(params.items()))}"
+
+    def _posted_window(self, posted_since: float | None) -> int | None:
+        """Seconds to request via `f_TPR`, bounded by `posted_within_days`."""
+
+        windows = []
+        if posted_since is not None:
+            windows.append(max(0, time.time() - posted_since) + POSTED_SINCE_SLACK)
+        if self.posted_within_days:
+            windows.append(self.posted_within_days * 86400)
+        if not windows:
+            return None
+        return math.ceil(min(windows))
+
+    def _params(self, start: int, posted_since: float | None = None) -> dict:
         params: dict = {"keywords": self.keywords, "start": start}
         if self.location:
             params["location"] = self.location
@@ -68,30 +264,48 @@ class LinkedInJobSource:
             params["f_WT"] = "1"
         if self.experience_level:
             params["f_E"] = self.experience_level
+        if self.job_type:
+            params["f_JT"] = self.job_type
+        if self.sort_by:
+            params["sortBy"] = self.sort_by
+        window = self._posted_window(posted_since)
+        if window is not None:
+            params["f_TPR"] = f"r{window}"
         return params
 
-    def _fetch_page(self, start: int) -> str:
-        response = self.client.get(SEARCH_URL, params=self._params(start))
+    def _prefilter(self, title: str, location: str | None) -> bool:
+        """Cheap title/location screen applied before a card is fully extracted."""
+
+        title = title.lower()
+        if self.title_include and not any(kw in title for kw in self.title_include):
+            return False
+        if any(kw in title for kw in self.title_exclude):
+            return False
+        if location and any(kw in location.lower() for kw in self.location_exclude):
+            return False
+        return True
+
+    def _fetch_page(self, start: int, posted_since: float | None = None) -> str:
+        response = self.client.get(SEARCH_URL, params=self._params(start, posted_since))
         response.raise_for_status()
         return response.text
 
-    def _parse_jobs(self, html: str) -> List[JobPosting]:
+    def _parse_jobs(self, html: str) -> Tuple[List[JobPosting], int, int]:
+        """Return the parsed jobs, the number of cards on the page and how many of them parsed.
+
+        Pre-filtered cards count as parsed; cards missing an ID, title or company do not.
+        """
+
         clean_html = html.replace("<!--", "").replace("-->", "")
         soup = BeautifulSoup(clean_html, "html.parser")
         jobs: List[JobPosting] = []
         seen_ids: set[str] = set()
+        filtered = 0
+        plan = self.selector_plan
+        plan.compile()
 
-        selectors = "a.base-card__full-link, a.job-card-container__link, a.job-card-list__title, a.result-card__full-card-link"
-        links = soup.select(selectors)
-        cards = soup.select(
-            "li.jobs-search-results__list-item, div.base-card[data-entity-urn], li.job-card-container"
-        )
-        logger.info(
-            "LinkedIn parser candidates: links=%s cards=%s html_len=%s",
-            len(links),
-            len(cards),
-            len(clean_html),
-        )
+        cards = soup.select(CARD_SELECTOR)
+        logger.info("LinkedIn parser candidates: cards=%s html_len=%s", len(cards), len(clean_html))
 
         for card in cards:
             job_id = (
@@ -102,38 +316,18 @@ class LinkedInJobSource:
             )
             if not job_id or job_id in seen_ids:
                 continue
-            link = card.select_one(selectors)
+            link = plan.first(card, "link", lambda node: node if node.has_attr("href") else None)
             url = ""
-            if link and link.has_attr("href"):
+            if link:
                 url = link["href"].split("?")[0]
-                if not job_id:
-                    job_id = self._extract_job_id(url, link)
-            if not job_id or job_id in seen_ids:
+            title = plan.first_text(card, "title", required=True)
+            location = plan.first_text(card, "location")
+            if title and not self._prefilter(title, location):
+                seen_ids.add(job_id)
+                filtered += 1
                 continue
-            title = self._first_text(
-                card,
-                [".base-search-card__title", ".job-card-list__title", ".sr-only"],
-            )
-            company = self._first_text(
-                card,
-                [
-                    ".base-search-card__subtitle",
-                    ".job-card-container__primary-description",
-                    ".hidden-nested-link",
-                ],
-            )
-            location = self._first_text(
-                card,
-                [".job-search-card__location", ".job-card-container__metadata-item"],
-            )
-            description = self._first_text(
-                card,
-                [
-                    ".base-search-card__snippet",
-                    ".job-card-container__metadata-item--bullet",
-                    ".job-card-container__metadata-wrapper",
-                ],
-            ) or "LinkedIn job listing"
+            company = plan.first_text(card, "company", required=True)
+            description = plan.first_text(card, "description") or "LinkedIn job listing"
             if not title or not company:
                 logger.debug(
                     "LinkedIn skipping structured card job_id=%s missing=%s",
@@ -154,10 +348,13 @@ class LinkedInJobSource:
                     metadata={"raw_id": job_id},
                 )
             )
-        if jobs:
-            logger.info("LinkedIn parsed %s structured jobs", len(jobs))
-            return jobs
+        if jobs or filtered:
+            logger.info("LinkedIn parsed %s structured jobs (%s pre-filtered)", len(jobs), filtered)
+            return jobs, len(cards), len(jobs) + filtered
 
+        # Only walk the page's bare links when no structured card parsed.
+        links = soup.select(", ".join(plan.candidates["link"]))
+        logger.info("LinkedIn falling back to %s bare links", len(links))
         for link in links:
             url = link.get("href", "").split("?")[0]
             job_id = self._extract_job_id(url, link)
@@ -166,27 +363,13 @@ class LinkedInJobSource:
 
             card = link.find_parent("li") or link.find_parent("div", class_="base-card") or link.parent
             title = link.get_text(strip=True)
-            company = self._first_text(
-                card,
-                [
-                    ".base-search-card__subtitle",
-                    ".job-card-container__primary-description",
-                ],
-            )
-            location = self._first_text(
-                card,
-                [
-                    ".job-search-card__location",
-                    ".job-card-container__metadata-item",
-                ],
-            )
-            description = self._first_text(
-                card,
-                [
-                    ".base-search-card__snippet",
-                    ".job-card-container__metadata-item--bullet",
-                ],
-            ) or "LinkedIn job listing"
+            location = plan.first_text(card, "location")
+            if title and not self._prefilter(title, location):
+                seen_ids.add(job_id)
+                filtered += 1
+                continue
+            company = plan.first_text(card, "company", required=True)
+            description = plan.first_text(card, "description") or "LinkedIn job listing"
 
             if not title or not company:
                 logger.debug(
@@ -210,23 +393,11 @@ class LinkedInJobSource:
                 )
             )
         if jobs:
-            logger.info("LinkedIn parsed %s fallback jobs", len(jobs))
+            logger.info("LinkedIn parsed %s fallback jobs (%s pre-filtered)", len(jobs), filtered)
         if not jobs:
             logger.info("LinkedIn search yielded 0 jobs (keywords=%s, location=%s)", self.keywords, self.location)
 
-        return jobs
-
-    @staticmethod
-    def _first_text(card: Tag | None, selectors: List[str]) -> str | None:
-        if card is None:
-            return None
-        for selector in selectors:
-            node = card.select_one(selector)
-            if node:
-                text = node.get_text(strip=True)
-                if text:
-                    return text
-        return None
+        return jobs, len(cards) or len(links), len(jobs) + filtered
 
     @staticmethod
     def _extract_job_id(url: str, link: Tag) -> str | None:
@@ -240,35 +411,75 @@ class LinkedInJobSource:
                     return value.split(":")[-1]
         return None
 
-    def search_jobs(self, profile: CandidateProfile, limit: int | None = None) -> List[JobPosting]:
+    def search_jobs(
+        self,
+        profile: CandidateProfile,
+        limit: int | None = None,
+        start: int = 0,
+        posted_since: float | None = None,
+        is_seen: Callable[[str], bool] | None = None,
+    ) -> List[JobPosting]:
+        """Fetch up to `limit` jobs starting at result offset `start`.
+
+        Without `is_seen` the crawl is bounded to the offsets `[start, start + limit)`
+        (one shard of a distributed run). With it, already-seen jobs are skipped and
+        do not count towards `limit`, so paging continues until `limit` new jobs are
+        found or the results run out.
+        """
+
         max_results = limit or self.limit
+        end = start + max_results if is_seen is None else MAX_OFFSET
         jobs: List[JobPosting] = []
-        start = 0
         seen_ids: set[str] = set()
+        self.last_search_ok = True
+        # Only a search that ran out of results covers the whole posted-since
+        # window; stopping at `limit` must not let the caller advance it.
+        self.exhausted = False
+        truncated = False
 
-        while len(jobs) < max_results:
+        while start < end and len(jobs) < max_results:
             logger.info("LinkedIn fetch start=%s keywords=%s location=%s", start, self.keywords, self.location)
             try:
-                html = self._fetch_page(start)
+                html = self._fetch_page(start, posted_since)
             except httpx.HTTPError as exc:
                 logger.warning("LinkedIn fetch failed (start=%s): %s", start, exc)
+                self.last_search_ok = False
                 break
-            batch = self._parse_jobs(html)
-            if not batch:
+            batch, page_size, parsed = self._parse_jobs(html)
+            if not page_size:
                 logger.info("LinkedIn returned no job cards for start=%s", start)
+                self.exhausted = True
+                break
+            if not parsed:
+                # Cards we cannot read are postings we never showed; don't let
+                # the caller treat the window as covered.
+                logger.warning("LinkedIn returned %s cards at start=%s but none parsed", page_size, start)
+                self.last_search_ok = False
                 break
             for job in batch:
-                if job.id in seen_ids:
+                if job.id in seen_ids or (is_seen and is_seen(job.id)):
                     continue
                 seen_ids.add(job.id)
                 jobs.append(job)
                 if len(jobs) >= max_results:
+                    truncated = True
                     break
-            start += len(batch)
+            start += page_size
+            if page_size < MIN_PAGE_SIZE and not truncated:
+                logger.info("LinkedIn returned a short page (%s cards) for start=%s", page_size, start - page_size)
+                self.exhausted = True
+                break
+        if start >= MAX_OFFSET and not truncated:
+            # LinkedIn serves nothing past this offset, so there is nothing more to reach.
+            self.exhausted = True
 
         if not jobs:
             logger.info("LinkedIn search yielded 0 jobs (keywords=%s, location=%s)", self.keywords, self.location)
 
+        try:
+            self.selector_plan.save()
+        except OSError as exc:
+            logger.warning("Could not persist LinkedIn selector stats: %s", exc)
         return jobs
 
     def apply(self, job: JobPosting, profile: CandidateProfile) -> ApplicationResult:
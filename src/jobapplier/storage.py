@@ -2,31 +2,233 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Optional
+
+_RECORD = struct.Struct("<QQ")  # (job key, first-seen epoch seconds)
+# With a retention window, rewrite the base at least this often so expired IDs are dropped.
+_EXPIRY_SWEEP = 86400
+
+
+def job_key(job_id: str) -> int:
+    """Map a job ID onto the uint64 key space used by `SeenIndex`.
+
+    Numeric IDs (LinkedIn) are used as-is; anything else is hashed.
+    """
+
+    if job_id.isdigit() and int(job_id) < 2**64:
+        return int(job_id)
+    return int.from_bytes(hashlib.blake2b(job_id.encode(), digest_size=8).digest(), "little")
+
+
+class SeenIndex:
+    """Memory-mapped set of seen job IDs with retention and compaction.
+
+    The base file holds `n` sorted little-endian uint64 keys followed by their
+    `n` first-seen timestamps, so lookups are a bisect over the mapped keys. New
+    (or expired and seen again) IDs go to an append-only delta file that is
+    folded into the base once it grows past `compact_threshold` records, or
+    daily when `retention_days` is set; entries older than the retention window
+    are dropped during that merge.
+
+    Retention counts from the first sighting: a listing that stays open for
+    longer than `retention_days` is forgotten and will be surfaced again.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        retention_days: Optional[int] = None,
+        compact_threshold: int = 4096,
+    ) -> None:
+        self.path = Path(path)
+        self.delta_path = self.path.with_name(self.path.name + ".delta")
+        self.retention = retention_days * 86400 if retention_days else None
+        self.compact_threshold = compact_threshold
+        self._map: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+        self._keys: Any = ()
+        self._stamps: Any = ()
+        self._delta: Dict[int, int] = {}
+        self._open_base()
+        self._load_delta()
+        if len(self._delta) >= self.compact_threshold or self._sweep_due():
+            self.compact()
+
+    def _sweep_due(self) -> bool:
+        if self.retention is None:
+            return False
+        if not self.path.exists():
+            return bool(self._delta)
+        return time.time() - self.path.stat().st_mtime >= _EXPIRY_SWEEP
+
+    def _open_base(self) -> None:
+        if not self.path.exists():
+            return
+        size = self.path.stat().st_size
+        if size == 0:
+            return
+        if size % _RECORD.size:
+            raise ValueError(f"Corrupt seen index {self.path}: size {size} is not a multiple of {_RECORD.size}")
+        count = size // _RECORD.size
+        if sys.byteorder != "little":
+            # The mapped view would use native byte order; load a swapped copy instead.
+            values = array("Q", self.path.read_bytes())
+            values.byteswap()
+            self._keys = values[:count]
+            self._stamps = values[count:]
+            return
+        with self.path.open("rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map).cast("Q")
+        self._keys = self._view[:count]
+        self._stamps = self._view[count:]
+
+    def _close_base(self) -> None:
+        if self._map is None:
+            self._keys = ()
+            self._stamps = ()
+            return
+        # Views must be released before the mapping can be closed.
+        self._keys.release()
+        self._stamps.release()
+        self._view.release()
+        self._view = None
+        self._keys = ()
+        self._stamps = ()
+        self._map.close()
+        self._map = None
+
+    def _load_delta(self) -> None:
+        if not self.delta_path.exists():
+            return
+        raw = self.delta_path.read_bytes()
+        usable = len(raw) - len(raw) % _RECORD.size  # ignore a torn trailing write
+        for key, stamp in _RECORD.iter_unpack(raw[:usable]):
+            # A later record for the same key means it expired and was seen again.
+            self._delta[key] = max(stamp, self._delta.get(key, 0))
+
+    def _cutoff(self, now: Optional[int] = None) -> int:
+        if self.retention is None:
+            return 0
+        return (now or int(time.time())) - self.retention
+
+    def _base_stamp(self, key: int) -> Optional[int]:
+        idx = bisect_left(self._keys, key)
+        if idx < len(self._keys) and self._keys[idx] == key:
+            return self._stamps[idx]
+        return None
+
+    def _stamp(self, key: int) -> Optional[int]:
+        stamp = self._delta.get(key)
+        return self._base_stamp(key) if stamp is None else stamp
+
+    def __contains__(self, job_id: str) -> bool:
+        stamp = self._stamp(job_key(job_id))
+        return stamp is not None and stamp >= self._cutoff()
+
+    def __len__(self) -> int:
+        return len(self._keys) + len(self._delta)
+
+    def add(self, job_id: str, seen_at: Optional[int] = None) -> None:
+        key = job_key(job_id)
+        current = self._stamp(key)
+        if current is not None and current >= self._cutoff():
+            return
+        stamp = seen_at or int(time.time())
+        with self.delta_path.open("ab") as handle:
+            handle.write(_RECORD.pack(key, stamp))
+        self._delta[key] = stamp
+        if len(self._delta) >= self.compact_threshold:
+            self.compact()
+
+    def add_many(self, job_ids: Iterable[str], seen_at: Optional[int] = None) -> None:
+        """Record many IDs with a single base rewrite and no per-ID delta writes."""
+
+        stamp = seen_at or int(time.time())
+        cutoff = self._cutoff()
+        for job_id in job_ids:
+            key = job_key(job_id)
+            current = self._stamp(key)
+            if current is None or current < cutoff:
+                self._delta[key] = stamp
+        self.compact()
+
+    def compact(self) -> None:
+        """Merge the delta into the base file and drop expired entries."""
+
+        cutoff = self._cutoff()
+        merged = {key: stamp for key, stamp in zip(self._keys, self._stamps) if stamp >= cutoff}
+        for key, stamp in self._delta.items():
+            if stamp >= cutoff:
+                merged[key] = max(stamp, merged.get(key, 0))
+        keys = sorted(merged)
+        payload = struct.pack(f"<{len(keys)}Q", *keys) + struct.pack(
+            f"<{len(keys)}Q", *(merged[key] for key in keys)
+        )
+
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_bytes(payload)
+        self._close_base()
+        os.replace(tmp_path, self.path)
+        self.delta_path.unlink(missing_ok=True)
+        self._delta = {}
+        self._open_base()
+
+    def close(self) -> None:
+        self._close_base()
 
 
 class JsonStateStore:
-    def __init__(self, path: str | Path) -> None:
+    def __init__(
+        self,
+        path: str | Path,
+        retention_days: Optional[int] = None,
+        compact_threshold: int = 4096,
+    ) -> None:
         self.path = Path(path)
-        self.data: Dict[str, Any] = {"seen_jobs": {}, "applications": {}}
+        self.data: Dict[str, Any] = {"applications": {}}
+        self.seen = SeenIndex(
+            self.path.with_name(self.path.name + ".seen"),
+            retention_days=retention_days,
+            compact_threshold=compact_threshold,
+        )
         self._load()
 
     def _load(self) -> None:
         if self.path.exists():
             self.data = json.loads(self.path.read_text())
+        legacy = self.data.pop("seen_jobs", None)
+        if legacy:
+            # Migrate state files written before the seen-index existed.
+            self.seen.add_many(legacy)
+            self._persist()
 
     def _persist(self) -> None:
         self.path.write_text(json.dumps(self.data, indent=2))
 
     def has_seen(self, job_id: str) -> bool:
-        return job_id in self.data["seen_jobs"]
+        return job_id in self.seen
+
+    def record_seen(self, job_id: str) -> None:
+        self.seen.add(job_id)
+
+    def last_run(self, key: str) -> Optional[float]:
+        return self.data.get("last_runs", {}).get(key)
 
-    def record_seen(self, job_id: str, meta: Dict[str, Any]) -> None:
-        self.data["seen_jobs"][job_id] = meta
+    def record_run(self, key: str, started_at: float) -> None:
+        self.data.setdefault("last_runs", {})[key] = started_at
         self._persist()
 
     def record_application(self, job_id: str, status: str, message: str) -> None:
-        self.data["applications"][job_id] = {"status": status, "message": message}
+        self.data.setdefault("applications", {})[job_id] = {"status": status, "message": message}
         self._persist()
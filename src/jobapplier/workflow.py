@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import logging
+import time
 from dataclasses import dataclass
-from typing import List
+from typing import List, Tuple
 
 from .config import AppConfig
+from .crawl_queue import CrawlQueue, default_worker_id, process_task
 from .notifiers.base import BaseNotifier
 from .profile import CandidateProfile
 from .scoring import rank_jobs, score_job
@@ -13,9 +16,12 @@ from .sources.base import JobPosting, JobSourceAdapter, registry
 from .storage import JsonStateStore
 
 # Ensure built-in adapters get registered.
+from .sources import feeds as _feeds  # noqa: F401
 from .sources import linkedin as _linkedin  # noqa: F401
 from .notifiers.cli import CliNotifier
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class AgentContext:
@@ -29,18 +35,104 @@ class AgentContext:
 class AgentWorkflow:
     def __init__(self, ctx: AgentContext) -> None:
         self.ctx = ctx
+        # (source, state key, start time) of searches that covered their whole window.
+        self._completed: List[Tuple[JobSourceAdapter, str, float]] = []
 
     def collect_jobs(self) -> List[JobPosting]:
         collected: List[JobPosting] = []
         for source in self.ctx.sources:
-            for job in source.search_jobs(self.ctx.profile):
+            started = time.time()
+            key = source_state_key(source)
+            jobs = source.search_jobs(
+                self.ctx.profile,
+                posted_since=self.ctx.store.last_run(key),
+                is_seen=self.ctx.store.has_seen,
+            )
+            for job in jobs:
                 if self.ctx.store.has_seen(job.id):
                     continue
                 collected.append(job)
+            if search_complete(source):
+                self._completed.append((source, key, started))
+        return collected
+
+    def collect_distributed(self, queue: CrawlQueue, work: bool = True) -> List[JobPosting]:
+        """Queue this run's crawl tasks, wait for workers, then merge and dedupe results.
+
+        With `work` enabled the coordinator also processes its own tasks while waiting.
+        Tasks still unfinished after `queue.run_timeout` seconds are failed.
+        """
+
+        settings = self.ctx.config.queue
+        started = time.time()
+        keys = [source_state_key(source) for source in self.ctx.sources]
+        run_id = queue.enqueue_run(
+            self.ctx.sources,
+            settings.page_size,
+            posted_since=[self.ctx.store.last_run(key) for key in keys],
+            purge_after=settings.purge_after,
+        )
+        owner = default_worker_id()
+        deadline = started + settings.run_timeout
+        last_status: dict = {}
+        while True:
+            status = queue.run_status(run_id)
+            if not status.get("pending") and not status.get("leased"):
+                break
+            if status != last_status:
+                logger.info("Crawl run %s progress: %s", run_id, status)
+                last_status = status
+            if time.time() >= deadline:
+                logger.warning(
+                    "Crawl run %s timed out after %ss with %s unfinished tasks",
+                    run_id,
+                    settings.run_timeout,
+                    status.get("pending", 0) + status.get("leased", 0),
+                )
+                queue.abandon_run(run_id, "run timed out")
+                break
+            task = queue.claim(owner, run_id=run_id) if work else None
+            if task is None:
+                time.sleep(settings.poll_interval)
+                continue
+            process_task(queue, task, owner, self.ctx.sources, self.ctx.profile)
+        failed = queue.failed_sources(run_id)
+        if failed:
+            logger.warning("Crawl run %s finished with failed tasks for sources %s", run_id, sorted(failed))
+        exhausted = queue.exhausted_sources(run_id)
+        for idx, key in enumerate(keys):
+            if idx in exhausted and idx not in failed:
+                self._completed.append((self.ctx.sources[idx], key, started))
+
+        collected: List[JobPosting] = []
+        merged: set[str] = set()
+        for job in queue.results(run_id):
+            if job.id in merged or self.ctx.store.has_seen(job.id):
+                continue
+            merged.add(job.id)
+            collected.append(job)
+        queue.purge_run(run_id)
         return collected
 
+    def commit_runs(self) -> None:
+        """Persist per-source progress (watermarks, feed validators) once the jobs were reviewed."""
+
+        for source, key, started in self._completed:
+            self.ctx.store.record_run(key, started)
+            commit = getattr(source, "commit_search", None)
+            if commit:
+                commit()
+        self._completed = []
+
     def run_once(self) -> None:
-        jobs = self.collect_jobs()
+        self.review_jobs(self.collect_jobs())
+        self.commit_runs()
+
+    def run_distributed(self, queue: CrawlQueue, work: bool = True) -> None:
+        self.review_jobs(self.collect_distributed(queue, work=work))
+        self.commit_runs()
+
+    def review_jobs(self, jobs: List[JobPosting]) -> None:
         if not jobs:
             self.ctx.notifier.request_approvals([], self.ctx.profile)
             return
@@ -48,7 +140,7 @@ class AgentWorkflow:
         for job in jobs:
             score = score_job(job, self.ctx.profile, self.ctx.config.scoring)
             job.metadata["score"] = score
-            self.ctx.store.record_seen(job.id, {"score": score, "source": job.source})
+            self.ctx.store.record_seen(job.id)
 
         min_score = float(self.ctx.config.approvals.get("min_score", 0))
         filtered = [job for job in jobs if job.metadata.get("score", 0) >= min_score]
@@ -67,6 +159,22 @@ class AgentWorkflow:
             self.ctx.store.record_application(decision.job.id, status, result.message)
 
 
+def source_state_key(source: JobSourceAdapter) -> str:
+    """Key under which per-source run bookkeeping is kept in the state store."""
+
+    return getattr(source, "state_key", source.name)
+
+
+def search_complete(source: JobSourceAdapter) -> bool:
+    """Whether the last search covered its whole posted-since window.
+
+    Only then may the run timestamp advance; a failed or `limit`-truncated
+    search keeps the previous watermark so the remaining postings are refetched.
+    """
+
+    return getattr(source, "last_search_ok", True) and getattr(source, "exhausted", True)
+
+
 def build_notifier(channel: str) -> BaseNotifier:
     if channel == "cli":
         return CliNotifier()
@@ -81,8 +189,20 @@ def build_sources(config: AppConfig) -> List[JobSourceAdapter]:
     return sources
 
 
+def build_queue(config: AppConfig) -> CrawlQueue:
+    return CrawlQueue(
+        config.queue.path,
+        lease_seconds=config.queue.lease_seconds,
+        max_attempts=config.queue.max_attempts,
+    )
+
+
 def build_context(config: AppConfig, profile: CandidateProfile) -> AgentContext:
-    store = JsonStateStore(config.storage.path)
+    store = JsonStateStore(
+        config.storage.path,
+        retention_days=config.storage.retention_days,
+        compact_threshold=config.storage.compact_threshold,
+    )
     notifier = build_notifier(config.notifications.channel)
     sources = build_sources(config)
     return AgentContext(config=config, profile=profile, sources=sources, notifier=notifier, store=store)